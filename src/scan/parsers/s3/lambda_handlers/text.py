@@ -1,10 +1,60 @@
 import boto3
+import codecs
 import re
-from typing import Any, Dict, Optional, Set
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from botocore.exceptions import ClientError
 
 from .base import LambdaBaseParser
 
+
+# Line boundaries recognised by str.splitlines(). / str.splitlines()가 인식하는 줄 경계
+_LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_LINE_BREAK_CHARS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def _last_line_break(text: str) -> int:
+    """
+    Find the end offset of the last line break in text. / 텍스트에서 마지막 줄바꿈의 끝 위치를 찾습니다.
+
+    A trailing '\\r' is ignored, since a '\\n' in the next chunk may complete it. /
+    끝의 '\\r'은 다음 청크의 '\\n'과 이어질 수 있으므로 무시합니다.
+
+    Args:
+        text (str): Text to search / 검색할 텍스트
+
+    Returns:
+        int: Offset just past the last line break, or 0 if there is none / 마지막 줄바꿈 바로 뒤의 위치, 없으면 0
+    """
+    end = len(text) - 1 if text.endswith("\r") else len(text)
+    return max(text.rfind(char, 0, end) for char in _LINE_BREAK_CHARS) + 1
+
+
+def _line_bounds(text: str) -> Tuple[List[int], List[int]]:
+    """
+    Collect start and end offsets of every line in text. / 텍스트의 모든 줄의 시작 및 끝 위치를 수집합니다.
+
+    Lines are split like str.splitlines(); a break at the very end does not open another line. /
+    줄은 str.splitlines()와 같이 나뉘며, 텍스트 끝의 줄바꿈은 새 줄을 만들지 않습니다.
+
+    Args:
+        text (str): Text to index / 인덱싱할 텍스트
+
+    Returns:
+        Tuple[List[int], List[int]]: Ascending line start offsets and line end offsets (excluding the break) / 오름차순 줄 시작 위치와 줄 끝 위치 (줄바꿈 제외)
+    """
+    line_starts, line_ends = [0], []
+    for match in _LINE_BREAK.finditer(text):
+        line_ends.append(match.start())
+        line_starts.append(match.end())
+        
+    if line_starts[-1] == len(text) and line_ends:
+        line_starts.pop()
+    else:
+        line_ends.append(len(text))
+    return line_starts, line_ends
+
 class TextParser(LambdaBaseParser):
     """
     Text file parser for PII detection in Lambda. / Lambda에서 개인정보 감지를 위한 텍스트 파일 파서"
@@ -13,6 +63,10 @@ class TextParser(LambdaBaseParser):
         LambdaBaseParser (_type_): _description_
     """
     DEFAULT_TEXT_EXTENSIONS = set()
+    CHUNK_SIZE = 1 << 20
+    SNIFF_SIZE = 4096
+    MAX_LINE_LENGTH = 4 << 20
+    LINE_OVERLAP = 4096
     
     def __init__(self, *args, text_extensions: Optional[Set[str]] = None, **kwargs):
         """
@@ -32,6 +86,8 @@ class TextParser(LambdaBaseParser):
         if not self.text_extensions:
             raise ValueError("Text extensions set cannot be empty. Please provide valid extensions.")
         
+        self._ext_tuple = tuple(ext.lower() for ext in self.text_extensions)
+        
     def can_handle(self, event: Dict[str, Any]) -> bool:
         """
         Check if S3 object is a text file. / S3 객체가 텍스트 파일인지 확인합니다.
@@ -44,7 +100,7 @@ class TextParser(LambdaBaseParser):
         """
         try:
             _, key = self.get_s3_info(event)
-            return any(key.lower().endswith(ext.lower()) for ext in self.text_extensions)
+            return key.lower().endswith(self._ext_tuple)
         
         except ClientError as e:
             self.logger.error(f"Error checking file type: {e}")
@@ -54,6 +110,10 @@ class TextParser(LambdaBaseParser):
         """
         Extract text content from S3 object. / S3 객체에서 텍스트를 추출합니다.
 
+        The text is read through iter_text_blocks, so it follows the same empty and binary object checks as
+        scan; the overlap repeated between windows of a long line is dropped. / 텍스트는 iter_text_blocks로 읽으므로
+        scan과 같은 빈 객체 및 바이너리 객체 검사를 따르며, 긴 줄의 창 사이에 반복되는 겹침 구간은 제외합니다.
+
         Args:
             event (Dict[str, Any]): Lambda S3 event dictionary / Lambda S3 이벤트 딕셔너리
             encoding (str): Encoding to use for text extraction / 텍스트 추출에 사용할 인코딩
@@ -62,52 +122,235 @@ class TextParser(LambdaBaseParser):
             Optional[str]: Extracted text or None if extraction fails / 추출된 텍스트 또는 실패 시 None
         """
         try:
-            bucket, key = self.get_s3_info(event)
-            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+            parts = []
+            for block, complete in self.iter_text_blocks(event, encoding):
+                parts.append(block if complete else block[:-self.LINE_OVERLAP])
+            return "".join(parts)
             
-            try:
-                return response['Body'].read().decode(encoding)
-            
-            except UnicodeDecodeError:
-                self.logger.error(f"Unicode decode error for {bucket}/{key} with encoding {encoding}: {e}")
-                return None  
+        except UnicodeDecodeError as e:
+            self.logger.error(f"Unicode decode error with encoding {encoding}: {e}")
+            return None
             
         except Exception as e:
-            self.logger.error(f"Error extracting text from {bucket}/{key}: {e}")
+            self.logger.error(f"Error extracting text from S3 object: {e}")
             return None
 
-    def scan(self, event: Dict[str, Any]) -> Dict[str, Any]:
-        """_summary_
+    def iter_text_blocks(self, event: Dict[str, Any], encoding: str = 'utf-8') -> Iterator[Tuple[str, bool]]:
+        """
+        Stream S3 object text in blocks of whole lines. / S3 객체 텍스트를 완전한 줄 단위 블록으로 스트리밍합니다.
+
+        The body is read in chunks of CHUNK_SIZE bytes and decoded incrementally; every complete block
+        except the last ends with a line break. A line longer than MAX_LINE_LENGTH is yielded in incomplete
+        windows that overlap by LINE_OVERLAP characters, so memory stays bounded. / 본문은 CHUNK_SIZE 바이트 단위로 읽고 점진적으로 디코딩하며,
+        마지막을 제외한 모든 완전한 블록은 줄바꿈으로 끝납니다. MAX_LINE_LENGTH보다 긴 줄은 LINE_OVERLAP 문자씩 겹치는 미완성 창으로 나누어 반환하므로 메모리 사용량이 제한됩니다.
+        Objects reported as empty by the event are not fetched, and objects with NUL bytes in the first
+        SNIFF_SIZE bytes are rejected as binary. / 이벤트에서 비어 있다고 보고된 객체는 가져오지 않으며, 처음 SNIFF_SIZE 바이트에 NUL 바이트가 있는 객체는 바이너리로 보고 거부합니다.
 
         Args:
-            event (Dict[str, Any]): _description_
+            event (Dict[str, Any]): Lambda S3 event dictionary / Lambda S3 이벤트 딕셔너리
+            encoding (str): Encoding to use for text extraction / 텍스트 추출에 사용할 인코딩
 
-        Returns:
-            List[str]: _description_
+        Yields:
+            Tuple[str, bool]: Block of decoded text, and False if it is a window of an unfinished line / 디코딩된 텍스트 블록과, 끝나지 않은 줄의 창이면 False
+
+        Raises:
+            ValueError: If the S3 event structure is invalid or the object starts with binary content / S3 이벤트 구조가 잘못되었거나 객체가 바이너리 내용으로 시작하는 경우 발생
+            UnicodeDecodeError: If the object cannot be decoded with the encoding / 객체를 지정한 인코딩으로 디코딩할 수 없는 경우 발생
         """
-        text = self.extract_text(event)
-        if text is None:
-            return {}
+        bucket, key = self.get_s3_info(event)
+        if event['Records'][0]['s3']['object'].get('size') == 0:
+            return
         
-        self.logger.info("Scanning entire text for PII patterns.")
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        
+        # Pieces of the unfinished last line, joined only once it ends. / 끝나지 않은 마지막 줄의 조각들, 줄이 끝날 때만 합칩니다.
+        pending = []
+        pending_length = 0
+        
+        # NUL bytes only mark binary content for ASCII-compatible encodings. / NUL 바이트는 ASCII 호환 인코딩에서만 바이너리 내용을 의미합니다.
+        check_binary = "\x00".encode(encoding) == b"\x00"
+        
+        for chunk in response['Body'].iter_chunks(chunk_size=self.CHUNK_SIZE):
+            if check_binary:
+                if b"\x00" in chunk[:self.SNIFF_SIZE]:
+                    raise ValueError(f"Binary content in {bucket}/{key}")
+                check_binary = False
                 
-        file_results = {"Type": "Text"}
+            piece = decoder.decode(chunk)
+            if not piece:
+                continue
+            
+            # A held back '\\r' not followed by '\\n' is a line break of its own. / 뒤에 '\\n'이 오지 않는 보류된 '\\r'은 그 자체로 줄바꿈입니다.
+            if pending and pending[-1].endswith("\r") and not piece.startswith("\n"):
+                yield "".join(pending), True
+                pending, pending_length = [], 0
+                
+            cut = _last_line_break(piece)
+            if cut:
+                pending.append(piece[:cut])
+                yield "".join(pending), True
+                pending, pending_length = [], 0
+                piece = piece[cut:]
+                
+            if piece:
+                pending.append(piece)
+                pending_length += len(piece)
+                
+            if pending_length > self.MAX_LINE_LENGTH and not piece.endswith("\r"):
+                window = "".join(pending)
+                yield window, False
+                overlap = window[-self.LINE_OVERLAP:]
+                pending, pending_length = [overlap], len(overlap)
+                
+        pending.append(decoder.decode(b"", final=True))
+        text = "".join(pending)
+        if text:
+            yield text, True
 
-        lines = text.splitlines()
+    def scan(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Scan S3 text object for PII patterns. / S3 텍스트 객체에서 개인정보 패턴을 검사합니다.
+
+        The object is streamed block by block through iter_text_blocks, the same read path as extract_text;
+        each pattern is searched over the whole block, or line by line when it is line-bound, and match
+        offsets are mapped to line numbers through a line offset index. / 객체는 extract_text와 같은 읽기 경로인
+        iter_text_blocks를 통해 블록 단위로 스트리밍되며, 각 패턴은 블록 전체 또는 줄 경계에 의존하는 경우 줄 단위로 검색되고
+        일치 위치는 줄 위치 인덱스로 줄 번호에 매핑됩니다.
+
+        Lines longer than MAX_LINE_LENGTH are searched in windows overlapping by LINE_OVERLAP characters:
+        matches longer than the overlap may be missed, and '^', '$' and lookarounds treat the window edges,
+        including the overlap start of the block that ends the line, as line edges, which can report false
+        positives on such lines. / MAX_LINE_LENGTH보다 긴 줄은 LINE_OVERLAP 문자씩 겹치는 창으로 검색합니다. 겹침보다 긴 일치 항목은
+        놓칠 수 있으며, '^', '$'와 전후방 탐색은 줄을 끝내는 블록의 겹침 시작을 포함한 창의 경계를 줄 경계로 취급하므로
+        이런 줄에서 오탐이 보고될 수 있습니다.
+
+        Args:
+            event (Dict[str, Any]): Lambda S3 event dictionary / Lambda S3 이벤트 딕셔너리
+
+        Returns:
+            Dict[str, Any]: Per-pattern line count and locations, None for patterns without matches, or an
+            empty dict if the object could not be read, decoded or was skipped as binary / 패턴별 줄 수와 위치, 일치 항목이 없으면 None,
+            객체를 읽거나 디코딩할 수 없거나 바이너리로 건너뛴 경우 빈 딕셔너리
+        """
+        self.logger.info("Scanning entire text for PII patterns.")
         
-        for pattern in self.patterns:
-            line_numbers = set()
+        line_numbers = [[] for _ in self.patterns]
+        line_offset = 0
+        
+        blocks = self.iter_text_blocks(event)
+        
+        while True:
+            # Only reading and decoding the object are guarded; scanning errors propagate. / 객체 읽기와 디코딩만 처리하며, 검사 오류는 그대로 전달됩니다.
+            try:
+                block, complete = next(blocks)
+                
+            except StopIteration:
+                break
+            
+            except UnicodeDecodeError as e:
+                self.logger.error(f"Unicode decode error while scanning S3 object: {e}")
+                return {}
+            
+            # Skipped objects return the failure shape, so they are never reported as free of PII. / 건너뛴 객체는 실패 형태를 반환하므로 개인정보가 없는 것으로 보고되지 않습니다.
+            except ValueError as e:
+                self.logger.warning(f"Skipping S3 object: {e}")
+                return {}
             
-            for line_number, line in enumerate(lines, start=1):
-                if re.search(pattern.pattern, line):
-                    line_numbers.add(line_number)
+            except Exception as e:
+                self.logger.error(f"Error reading S3 object: {e}")
+                return {}
             
-            if line_numbers:
+            if complete:
+                line_offset += self._scan_block(block, line_offset, line_numbers)
+            else:
+                self._scan_window(block, line_offset + 1, line_numbers)
+                
+        file_results = {"Type": "Text"}
+        
+        for pattern, found in zip(self.patterns, line_numbers):
+            if found:
                 file_results[pattern.name] = {
-                    "pii-total": len(line_numbers),
-                    "location": sorted(line_numbers)
+                    "pii-total": len(found),
+                    "location": found
                 }
             else:
                 file_results[pattern.name] = None
                         
-        return file_results
\ No newline at end of file
+        return file_results
+    
+    def _scan_block(self, text: str, line_offset: int, line_numbers: List[List[int]]) -> int:
+        """
+        Collect matching line numbers in one block of text. / 텍스트 블록 하나에서 일치하는 줄 번호를 수집합니다.
+
+        Results match searching every line on its own: line-bound patterns, including those whose tokens
+        can match a line break, are searched line by line, so a search over the block never runs past the
+        line holding its match. / 결과는 각 줄을 따로 검색한 것과 같습니다. 줄바꿈과 일치할 수 있는 토큰을 가진 패턴을 포함해
+        줄 경계에 의존하는 패턴은 줄 단위로 검색하므로, 블록 검색은 일치 항목이 있는 줄을 넘어 진행되지 않습니다.
+
+        Args:
+            text (str): Block of text ending on a line boundary / 줄 경계에서 끝나는 텍스트 블록
+            line_offset (int): Number of lines before this block / 이 블록 앞에 있는 줄 수
+            line_numbers (List[List[int]]): Per-pattern ascending line numbers, appended in place / 패턴별 오름차순 줄 번호, 제자리에서 추가
+
+        Note:
+            The first line may already be recorded from windows of the same long line. / 첫 줄은 같은 긴 줄의 창에서 이미 기록되었을 수 있습니다.
+
+        Returns:
+            int: Number of complete lines in the block / 블록의 완전한 줄 수
+        """
+        line_starts, line_ends = _line_bounds(text)
+        line_count = len(line_starts)
+        
+        for pattern, found in zip(self.patterns, line_numbers):
+            # Text without the pattern's required literal cannot match. / 패턴의 필수 리터럴이 없는 텍스트는 일치할 수 없습니다.
+            if pattern.literal and pattern.literal not in text:
+                continue
+            
+            search = pattern.compiled.search
+            append = found.append
+            
+            if pattern.line_bound:
+                for line_index, (start, end) in enumerate(zip(line_starts, line_ends)):
+                    if search(text[start:end]) and (not found or found[-1] != line_offset + line_index + 1):
+                        append(line_offset + line_index + 1)
+                continue
+            
+            match = search(text)
+            while match:
+                line_index = bisect_right(line_starts, match.start()) - 1
+                end = line_ends[line_index]
+                
+                # A match running past the line end is only valid if the line matches alone. / 줄 끝을 넘는 일치 항목은 그 줄만으로 일치할 때만 유효합니다.
+                if (match.end() <= end or search(text[line_starts[line_index]:end])) and (
+                    not found or found[-1] != line_offset + line_index + 1
+                ):
+                    append(line_offset + line_index + 1)
+                
+                # Resuming at the next line keeps line numbers unique and ascending. / 다음 줄부터 다시 검색하므로 줄 번호가 중복 없이 오름차순으로 유지됩니다.
+                if line_index + 1 == line_count:
+                    break
+                match = search(text, line_starts[line_index + 1])
+                
+        # The last line only counts as complete when the block ends with a break. / 블록이 줄바꿈으로 끝날 때만 마지막 줄이 완전한 줄로 계산됩니다.
+        return line_count if line_ends[-1] < len(text) else line_count - 1
+
+    def _scan_window(self, text: str, line_number: int, line_numbers: List[List[int]]) -> None:
+        """
+        Collect matches in a window of a line longer than MAX_LINE_LENGTH. / MAX_LINE_LENGTH보다 긴 줄의 창에서 일치 항목을 수집합니다.
+
+        Matches longer than LINE_OVERLAP may be missed, and line anchors see the window edges. /
+        LINE_OVERLAP보다 긴 일치 항목은 놓칠 수 있으며, 줄 앵커는 창의 경계를 줄 경계로 인식합니다.
+
+        Args:
+            text (str): Window of the line, without line breaks / 줄바꿈이 없는 줄의 창
+            line_number (int): Number of the line the window belongs to / 창이 속한 줄 번호
+            line_numbers (List[List[int]]): Per-pattern ascending line numbers, appended in place / 패턴별 오름차순 줄 번호, 제자리에서 추가
+        """
+        for pattern, found in zip(self.patterns, line_numbers):
+            if found and found[-1] == line_number:
+                continue
+            if pattern.literal and pattern.literal not in text:
+                continue
+            if pattern.compiled.search(text):
+                found.append(line_number)
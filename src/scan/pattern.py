@@ -1,8 +1,16 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Iterator, List, Optional, Tuple
 import json
+import re
+import sys
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
 
 class RiskLevel(Enum):
     """Enumeration defining risk levels for PII patterns. / PII 패턴의 위험도 레벨을 정의하는 열거형
@@ -16,7 +24,7 @@ class RiskLevel(Enum):
     MEDIUM = "MEDIUM"
     LOW = "LOW"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataPattern:
     """Data class containing PII pattern information. / PII 패턴 정보를 담는 데이터 클래스
 
@@ -25,11 +33,215 @@ class DataPattern:
         pattern: Regular expression pattern string / 정규표현식 패턴 문자열
         risk_level: Risk level (RiskLevel enum) / 위험도 레벨 (RiskLevel 열거형)
         description: Pattern description / 패턴에 대한 설명
+        compiled: Compiled regular expression / 컴파일된 정규표현식
+        literal: Literal every match contains, or None / 모든 일치 항목에 포함되는 리터럴 또는 None
+        line_bound: Whether the pattern must be searched line by line / 패턴을 줄 단위로 검색해야 하는지 여부
+
+    Raises:
+        re.error: When pattern is not a valid regular expression / 패턴이 올바른 정규표현식이 아닌 경우
     """
     name: str
     pattern: str
     risk_level: RiskLevel
     description: str
+    compiled: re.Pattern = field(init=False, repr=False, compare=False)
+    literal: Optional[str] = field(init=False, repr=False, compare=False)
+    line_bound: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "compiled", re.compile(self.pattern))
+        literal, line_bound = _analyze(self.pattern)
+        object.__setattr__(self, "literal", literal)
+        object.__setattr__(self, "line_bound", line_bound)
+
+def _literal_runs(items: Any) -> List[str]:
+    """Collect literal runs every match of a parsed sequence must contain. / 파싱된 시퀀스의 모든 일치 항목에 반드시 포함되는 리터럴 구간을 수집합니다.
+
+    Args:
+        items: Parsed regular expression sequence / 파싱된 정규표현식 시퀀스
+
+    Returns:
+        List[str]: Required literal runs / 필수 리터럴 구간 리스트
+    """
+    runs, current = [], []
+    for op, av in items:
+        if op is sre_parse.IN and len(av) == 1 and av[0][0] is sre_parse.LITERAL:
+            op, av = av[0]
+
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+            continue
+
+        runs.append("".join(current))
+        current = []
+        if op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            runs.extend(_literal_runs(av[3]))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            runs.extend(_literal_runs(av[2]))
+
+    runs.append("".join(current))
+    return runs
+
+def required_literal(pattern: str) -> Optional[str]:
+    """Find the longest literal that every match of a pattern contains. / 패턴의 모든 일치 항목에 포함되는 가장 긴 리터럴을 찾습니다.
+
+    Text without this literal cannot match the pattern, so the regex search can be skipped. /
+    이 리터럴이 없는 텍스트는 패턴과 일치할 수 없으므로 정규식 검색을 생략할 수 있습니다.
+
+    Args:
+        pattern: Regular expression pattern string / 정규표현식 패턴 문자열
+
+    Returns:
+        Optional[str]: Required literal, or None if the pattern has none / 필수 리터럴, 없으면 None
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    return _required_literal(parsed)
+
+def _required_literal(parsed: Any) -> Optional[str]:
+    """Find the longest required literal in a parsed pattern. / 파싱된 패턴에서 가장 긴 필수 리터럴을 찾습니다.
+
+    Args:
+        parsed: Parsed regular expression / 파싱된 정규표현식
+
+    Returns:
+        Optional[str]: Required literal, or None if the pattern has none / 필수 리터럴, 없으면 None
+    """
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+
+    return max(_literal_runs(parsed), key=len) or None
+
+def _iter_nodes(items: Any) -> Iterator[Tuple[Any, Any]]:
+    """Walk every node of a parsed regular expression. / 파싱된 정규표현식의 모든 노드를 순회합니다.
+
+    Args:
+        items: Parsed regular expression sequence / 파싱된 정규표현식 시퀀스
+
+    Yields:
+        Tuple[Any, Any]: Opcode and argument of each node / 각 노드의 연산 코드와 인자
+    """
+    for op, av in items:
+        yield op, av
+        for child in av if isinstance(av, (tuple, list)) else (av,):
+            for sub in child if isinstance(child, list) else (child,):
+                if isinstance(sub, sre_parse.SubPattern):
+                    yield from _iter_nodes(sub)
+
+# Line boundaries recognised by str.splitlines(). / str.splitlines()가 인식하는 줄 경계
+_LINE_BREAK_CHARS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+_CATEGORY_CLASSES = {
+    sre_parse.CATEGORY_DIGIT: r"\d",
+    sre_parse.CATEGORY_NOT_DIGIT: r"\D",
+    sre_parse.CATEGORY_SPACE: r"\s",
+    sre_parse.CATEGORY_NOT_SPACE: r"\S",
+    sre_parse.CATEGORY_WORD: r"\w",
+    sre_parse.CATEGORY_NOT_WORD: r"\W",
+}
+
+def _in_set(char: str, items: Any, flags: int) -> bool:
+    """Check whether a character belongs to a parsed character set. / 문자가 파싱된 문자 집합에 속하는지 확인합니다.
+
+    Args:
+        char: Character to check / 확인할 문자
+        items: Parsed character set items / 파싱된 문자 집합 항목
+        flags: Global flags of the pattern / 패턴의 전역 플래그
+
+    Returns:
+        bool: True if the set matches the character / 집합이 문자와 일치하면 True
+    """
+    negate, hit = False, False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            hit = hit or chr(av) == char
+        elif op is sre_parse.RANGE:
+            hit = hit or av[0] <= ord(char) <= av[1]
+        elif op is sre_parse.CATEGORY:
+            hit = hit or bool(re.match(_CATEGORY_CLASSES[av], char, flags & re.ASCII))
+
+    return hit != negate
+
+def _matches_line_break(op: Any, av: Any, flags: int) -> bool:
+    """Check whether a single-character node can match a line break. / 단일 문자 노드가 줄바꿈과 일치할 수 있는지 확인합니다.
+
+    Args:
+        op: Opcode of the node / 노드의 연산 코드
+        av: Argument of the node / 노드의 인자
+        flags: Global flags of the pattern / 패턴의 전역 플래그
+
+    Returns:
+        bool: True if the node can consume a line break / 노드가 줄바꿈을 소비할 수 있으면 True
+    """
+    if op in (sre_parse.ANY, sre_parse.NOT_LITERAL):
+        return True
+    if op is sre_parse.LITERAL:
+        return chr(av) in _LINE_BREAK_CHARS
+    if op is sre_parse.IN:
+        return any(_in_set(char, av, flags) for char in _LINE_BREAK_CHARS)
+    return False
+
+def is_line_bound(pattern: str) -> bool:
+    """Check whether a pattern must be searched line by line. / 패턴을 줄 단위로 검색해야 하는지 확인합니다.
+
+    Anchors other than word boundaries and lookaround assertions behave differently on a single line
+    than on text holding several lines. Tokens that can consume a line break (negated sets, \\s, \\W,
+    \\D, '.', literal breaks) let a search over several lines run far past the line it started on. /
+    단어 경계 이외의 앵커와 전후방 탐색은 한 줄과 여러 줄 텍스트에서 다르게 동작합니다. 줄바꿈을 소비할 수 있는 토큰
+    (부정 집합, \\s, \\W, \\D, '.', 줄바꿈 리터럴)은 여러 줄에 대한 검색이 시작한 줄을 훨씬 넘어 진행되게 합니다.
+
+    Args:
+        pattern: Regular expression pattern string / 정규표현식 패턴 문자열
+
+    Returns:
+        bool: True if the pattern uses anchors, lookarounds or tokens matching a line break / 앵커, 전후방 탐색 또는 줄바꿈과 일치하는 토큰을 사용하면 True
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return True
+
+    return _is_line_bound(parsed)
+
+def _is_line_bound(parsed: Any) -> bool:
+    """Check whether a parsed pattern must be searched line by line. / 파싱된 패턴을 줄 단위로 검색해야 하는지 확인합니다.
+
+    Args:
+        parsed: Parsed regular expression / 파싱된 정규표현식
+
+    Returns:
+        bool: True if the pattern uses anchors, lookarounds or tokens matching a line break / 앵커, 전후방 탐색 또는 줄바꿈과 일치하는 토큰을 사용하면 True
+    """
+    for op, av in _iter_nodes(parsed):
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            return True
+        if op is sre_parse.AT and av not in (sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY):
+            return True
+        if _matches_line_break(op, av, parsed.state.flags):
+            return True
+
+    return False
+
+def _analyze(pattern: str) -> Tuple[Optional[str], bool]:
+    """Derive the required literal and line-bound flag from one parse of a pattern. / 패턴을 한 번 파싱하여 필수 리터럴과 줄 경계 의존 여부를 구합니다.
+
+    Args:
+        pattern: Regular expression pattern string / 정규표현식 패턴 문자열
+
+    Returns:
+        Tuple[Optional[str], bool]: Required literal or None, and whether the pattern is line-bound / 필수 리터럴 또는 None과 줄 경계 의존 여부
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None, True
+
+    return _required_literal(parsed), _is_line_bound(parsed)
 
 class PatternLoader:
     """Class for loading PII patterns from JSON files. / JSON 파일에서 PII 패턴을 로드하는 클래스"""
@@ -47,23 +259,40 @@ class PatternLoader:
         Raises:
             FileNotFoundError: When pattern file is not found / 패턴 파일을 찾을 수 없는 경우
             json.JSONDecodeError: When JSON file format is invalid / JSON 파일 형식이 잘못된 경우
+            re.error: When a pattern is not a valid regular expression / 패턴이 올바른 정규표현식이 아닌 경우
         """
         path = Path(pattern_file)
         if not path.exists():
             raise FileNotFoundError(f"Not found Pattern file: {pattern_file}")
         
-        with path.open("r", encoding="utf-8") as f:
+        stat = path.stat()
+        return list(PatternLoader._load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_cached(pattern_file: str, mtime_ns: int, size: int) -> Tuple[DataPattern, ...]:
+        """Parse a pattern file, cached by path and file version. / 경로와 파일 버전 기준으로 캐시하여 패턴 파일을 파싱합니다.
+
+        Args:
+            pattern_file: Resolved path to pattern definition JSON file / 패턴 정의 JSON 파일의 절대 경로
+            mtime_ns: File modification time, invalidates the cache on change / 파일 수정 시각, 변경 시 캐시를 무효화
+            size: File size, invalidates the cache on change / 파일 크기, 변경 시 캐시를 무효화
+
+        Returns:
+            Tuple[DataPattern, ...]: Loaded PII pattern objects / 로드된 PII 패턴 객체들
+        """
+        with open(pattern_file, "r", encoding="utf-8") as f:
             data = json.load(f)
 
         patterns = []
         for risk_level, pattern_list in data["patterns"].items():
             for p in pattern_list:
                 pattern = DataPattern(
-                    name = p["name"],
+                    name = sys.intern(p["name"]),
                     pattern = p["pattern"],
                     risk_level = RiskLevel[risk_level],
                     description = p.get("description", "")
                 )
                 patterns.append(pattern)
 
-        return patterns
+        return tuple(patterns)
@@ -1,10 +1,19 @@
 import logging
+import os
 import sys
 from pathlib import Path
 
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 def setup_logger(name: str, log_level: str = "INFO", log_file: str = None) -> logging.Logger:
     """Initialize logger configuration. / 로거 설정을 초기화합니다.
 
+        Repeated calls for the same name update the level and add only handlers that are missing,
+        so a logger never writes a record twice. / 같은 이름으로 반복 호출하면 레벨만 갱신하고 없는 핸들러만 추가하므로 레코드가 중복 출력되지 않습니다.
+
         Args:
             name (str): Logger name / 로거 이름
             log_level (str, optional): Logging level. Defaults to "INFO". / 로깅 레벨. 기본값은 "INFO".
@@ -15,21 +24,22 @@ def setup_logger(name: str, log_level: str = "INFO", log_file: str = None) -> lo
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
+    logger.propagate = False
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if not getattr(logger, "_pypii_configured", False):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_FORMATTER)
+        logger.addHandler(console_handler)
+        logger._pypii_configured = True
 
-    if log_file:
+    if log_file and not any(
+        isinstance(handler, logging.FileHandler) and handler.baseFilename == os.path.abspath(log_file)
+        for handler in logger.handlers
+    ):
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
     return logger
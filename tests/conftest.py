@@ -0,0 +1,53 @@
+import json
+import pytest
+
+@pytest.fixture(scope="session")
+def pattern_json_path(tmp_path_factory):
+    """Create temporary pattern file for testing. / 테스트용 임시 패턴 파일을 생성합니다.
+    
+    Args:
+        tmp_path_factory: Session temporary directory factory provided by pytest / pytest에서 제공하는 세션 임시 디렉토리 팩토리
+
+    Returns:
+        Path: Path to temporary pattern file / 임시 패턴 파일의 경로
+        
+    Note:
+        - Creates a JSON file with sample patterns / 샘플 패턴이 포함된 JSON 파일 생성
+        - Includes patterns for all risk levels / 모든 위험도 레벨의 패턴 포함
+        - Created once per test session; tests must not modify it / 테스트 세션당 한 번 생성되며 테스트에서 수정하면 안 됨
+    """
+    pattern_data = {
+        "patterns": {
+            "HIGH": [
+                {
+                    "name": "RRN",
+                    "pattern": "(?:[0-9]{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[1,2][0-9]|3[0,1]))-[1-4][0-9]{6}",
+                    "description": "RRN Pattern (YYMMDD-XXXXXXX)"
+                },
+                {
+                    "name": "BIN",
+                    "pattern": "(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|3(?:0[0-5]|[68][0-9])[0-9]{11})",
+                    "description": "BIN Pattern"
+                }
+            ],
+            "MEDIUM": [
+                {
+                    "name": "Phone Number",
+                    "pattern": "01[016789]-?\\d{3,4}-?\\d{4}",
+                    "description": "Korea Phone number Pattern"
+                }
+            ],
+            "LOW": [
+                {
+                    "name": "Email",
+                    "pattern": "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}",
+                    "description": "Email Pattern"
+                }
+            ]
+        }
+    }
+    
+    pattern_file = tmp_path_factory.mktemp("patterns") / "test_patterns.json"
+    pattern_file.write_text(json.dumps(pattern_data, ensure_ascii=False), encoding="utf-8")
+    
+    return pattern_file
@@ -1,3 +1,4 @@
+import io
 import os
 import pytest
 import logging
@@ -45,25 +46,44 @@ def test_setup_logger_with_custom_level():
     logger = setup_logger(name="test", log_level="DEBUG")
     assert logger.level == logging.DEBUG
 
-def test_setup_logger_with_file(temp_log_file):
+class MemoryFileHandler(logging.StreamHandler):
+    """File handler stand-in writing to memory. / 메모리에 기록하는 파일 핸들러 대체 클래스
+
+    Args:
+        filename: Log file path, recorded but never opened / 로그 파일 경로, 기록만 하고 열지 않음
+        encoding: Requested file encoding / 요청된 파일 인코딩
+    """
+
+    def __init__(self, filename, encoding=None):
+        super().__init__(io.StringIO())
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+
+def test_setup_logger_with_file(temp_log_file, monkeypatch):
     """Test file logging functionality. / 파일 로깅 기능 테스트
     
     Args:
         temp_log_file: Temporary log file path from pytest fixture / pytest fixture로 생성된 임시 로그 파일 경로
+        monkeypatch: pytest fixture replacing logging.FileHandler / logging.FileHandler를 대체하는 pytest fixture
 
     Verification Items / 검증 항목:
-        1. Verify log file is created / 로그 파일이 실제로 생성되는지 확인
-        2. Verify log message is written correctly / 로그 메시지가 파일에 정확히 기록되는지 확인
-        3. Verify UTF-8 encoding is used / 파일이 UTF-8로 올바르게 인코딩되는지 확인
+        1. Verify a file handler is attached for the log file / 로그 파일용 파일 핸들러가 추가되는지 확인
+        2. Verify log message is written correctly / 로그 메시지가 정확히 기록되는지 확인
+        3. Verify UTF-8 encoding is used / UTF-8 인코딩이 사용되는지 확인
+
+    Note:
+        - Output is captured in memory; on-disk writing is covered by test_setup_logger_creates_log_directory /
+          출력은 메모리에 기록되며, 실제 디스크 기록은 test_setup_logger_creates_log_directory에서 검증
     """
+    monkeypatch.setattr(logging, "FileHandler", MemoryFileHandler)
     logger = setup_logger(name="test", log_file=temp_log_file)
     test_message = "Test log message"
     logger.info(test_message)
 
-    assert os.path.exists(temp_log_file)
-    with open(temp_log_file, "r", encoding="utf-8") as f:
-        log_content = f.read()
-        assert test_message in log_content
+    handler = next(h for h in logger.handlers if isinstance(h, MemoryFileHandler))
+    assert handler.baseFilename == os.path.abspath(temp_log_file)
+    assert handler.encoding == "utf-8"
+    assert test_message in handler.stream.getvalue()
 
 def test_setup_logger_with_invalid_level():
     """Test exception handling for invalid log level. / 잘못된 로그 레벨 입력 시 예외 처리 테스트
@@ -93,4 +113,24 @@ def test_setup_logger_creates_log_directory(temp_log_file):
     nested_log_path = os.path.join(os.path.dirname(temp_log_file), "nested", "path", "test.log")
     logger = setup_logger(name="test_logger", log_file=nested_log_path)
     logger.info("test")
-    assert os.path.exists(nested_log_path)
\ No newline at end of file
+    assert os.path.exists(nested_log_path)
+
+def test_setup_logger_is_idempotent(temp_log_file):
+    """Test repeated setup does not duplicate handlers. / 반복 설정 시 핸들러가 중복되지 않는지 테스트
+    
+    Args:
+        temp_log_file: Temporary log file path from pytest fixture / pytest fixture로 생성된 임시 로그 파일 경로
+
+    Verification Items / 검증 항목:
+        1. Verify console handler is added only once / 콘솔 핸들러가 한 번만 추가되는지 확인
+        2. Verify file handler is added only once per path / 파일 핸들러가 경로당 한 번만 추가되는지 확인
+        3. Verify log level is updated on each call / 호출마다 로그 레벨이 갱신되는지 확인
+        4. Verify records do not propagate to the root logger / 레코드가 루트 로거로 전파되지 않는지 확인
+    """
+    setup_logger(name="test_idempotent")
+    setup_logger(name="test_idempotent", log_file=temp_log_file)
+    logger = setup_logger(name="test_idempotent", log_level="DEBUG", log_file=temp_log_file)
+
+    assert len(logger.handlers) == 2
+    assert logger.level == logging.DEBUG
+    assert logger.propagate is False
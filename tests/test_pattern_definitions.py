@@ -1,57 +1,9 @@
+import dataclasses
 import pytest
 import json
-from src.scan.pattern import RiskLevel, DataPattern, PatternLoader
-
-@pytest.fixture
-def sample_pattern_file(tmp_path):
-    """Create temporary pattern file for testing. / 테스트용 임시 패턴 파일을 생성합니다.
-    
-    Args:
-        tmp_path: Temporary directory path provided by pytest / pytest에서 제공하는 임시 디렉토리 경로
-
-    Returns:
-        Path: Path to temporary pattern file / 임시 패턴 파일의 경로
-        
-    Note:
-        - Creates a JSON file with sample patterns / 샘플 패턴이 포함된 JSON 파일 생성
-        - Includes patterns for all risk levels / 모든 위험도 레벨의 패턴 포함
-    """
-    pattern_data = {
-        "patterns": {
-            "HIGH": [
-                {
-                    "name": "RRN",
-                    "pattern": "(?:[0-9]{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[1,2][0-9]|3[0,1]))-[1-4][0-9]{6}",
-                    "description": "RRN Pattern (YYMMDD-XXXXXXX)"
-                },
-                {
-                    "name": "BIN",
-                    "pattern": "(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|3(?:0[0-5]|[68][0-9])[0-9]{11})",
-                    "description": "BIN Pattern"
-                }
-            ],
-            "MEDIUM": [
-                {
-                    "name": "Phone Number",
-                    "pattern": "01[016789]-?\\d{3,4}-?\\d{4}",
-                    "description": "Korea Phone number Pattern"
-                }
-            ],
-            "LOW": [
-                {
-                    "name": "Email",
-                    "pattern": "[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}",
-                    "description": "Email Pattern"
-                }
-            ]
-        }
-    }
-    
-    pattern_file = tmp_path / "test_patterns.json"
-    with pattern_file.open("w", encoding="utf-8") as f:
-        json.dump(pattern_data, f, ensure_ascii=False, indent=2)
-    
-    return pattern_file
+import re
+from src.scan import pattern as pattern_module
+from src.scan.pattern import RiskLevel, DataPattern, PatternLoader, is_line_bound, required_literal
 
 def test_risk_level_enum():
     """Test RiskLevel enumeration values. / RiskLevel 열거형 값을 테스트합니다.
@@ -88,11 +40,69 @@ def test_data_pattern_creation():
     assert pattern.risk_level == RiskLevel.HIGH
     assert pattern.description == "Test pattern description"
 
-def test_pattern_loader_with_valid_file(sample_pattern_file):
+def test_data_pattern_compiles_once():
+    """Test DataPattern compiles its regex at construction. / DataPattern이 생성 시 정규식을 컴파일하는지 테스트합니다.
+    
+    Verification Items / 검증 항목:
+        1. Verify compiled regex matches pattern string with default flags / 컴파일된 정규식이 기본 플래그로 패턴 문자열과 일치하는지 검증
+        2. Verify required literal is extracted / 필수 리터럴이 추출되는지 검증
+        3. Verify compiled fields are excluded from equality / 컴파일 필드가 동등성 비교에서 제외되는지 검증
+    """
+    pattern = DataPattern(name="Email", pattern=r"\w+@\w+", risk_level=RiskLevel.LOW, description="Email")
+
+    assert pattern.compiled.pattern == r"\w+@\w+"
+    assert pattern.compiled.search("user@example")
+    assert pattern.compiled.flags == re.compile(r"\w+@\w+").flags
+    assert pattern.literal == "@"
+    assert pattern == DataPattern(name="Email", pattern=r"\w+@\w+", risk_level=RiskLevel.LOW, description="Email")
+
+def test_data_pattern_parses_once(monkeypatch):
+    """Test DataPattern derives its literal and line-bound flag from one parse. / DataPattern이 한 번의 파싱으로 리터럴과 줄 경계 의존 여부를 구하는지 테스트합니다.
+    
+    Args:
+        monkeypatch: Pytest monkeypatch fixture / pytest monkeypatch fixture
+
+    Verification Items / 검증 항목:
+        1. Verify the pattern is parsed once outside re.compile / re.compile 외부에서 패턴이 한 번 파싱되는지 검증
+        2. Verify both derived fields are set / 두 파생 필드가 설정되는지 검증
+    """
+    regex = r"^name:[^,]+,$"
+    re.compile(regex)
+    parse = pattern_module.sre_parse.parse
+    calls = []
+    monkeypatch.setattr(pattern_module.sre_parse, "parse", lambda *args: calls.append(args) or parse(*args))
+
+    pattern = DataPattern(name="Name", pattern=regex, risk_level=RiskLevel.LOW, description="Name")
+
+    assert len(calls) == 1
+    assert pattern.literal == "name:"
+    assert pattern.line_bound
+
+def test_data_pattern_is_frozen():
+    """Test DataPattern instances are immutable. / DataPattern 인스턴스가 변경 불가능한지 테스트합니다.
+    
+    Verification Items / 검증 항목:
+        1. Verify attribute assignment is rejected / 속성 할당이 거부되는지 검증
+    """
+    pattern = DataPattern(name="Test Pattern", pattern=r"\d+", risk_level=RiskLevel.HIGH, description="Test")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pattern.pattern = r"\w+"
+
+def test_data_pattern_with_invalid_regex():
+    """Test exception handling for invalid regex. / 잘못된 정규식에 대한 예외 처리를 테스트합니다.
+    
+    Expected Behavior / 예상 동작:
+        - Should raise re.error at construction / 생성 시 re.error 발생
+    """
+    with pytest.raises(re.error):
+        DataPattern(name="Invalid", pattern="(", risk_level=RiskLevel.LOW, description="Invalid pattern")
+
+def test_pattern_loader_with_valid_file(pattern_json_path):
     """Test pattern loading with valid JSON file. / 유효한 JSON 파일에서 패턴 로딩을 테스트합니다.
     
     Args:
-        sample_pattern_file: Path to test pattern file / 테스트 패턴 파일 경로
+        pattern_json_path: Path to test pattern file / 테스트 패턴 파일 경로
 
     Verification Items / 검증 항목:
         1. Verify total number of patterns loaded / 로드된 전체 패턴 수 검증
@@ -100,7 +110,7 @@ def test_pattern_loader_with_valid_file(sample_pattern_file):
         3. Verify required attributes exist / 필수 속성 존재 여부 검증
         4. Verify risk level types / 위험도 레벨 타입 검증
     """
-    patterns = PatternLoader.load_patterns(str(sample_pattern_file))
+    patterns = PatternLoader.load_patterns(str(pattern_json_path))
 
     assert len(patterns) == 4
 
@@ -142,4 +152,93 @@ def test_pattern_loader_with_invalid_json(tmp_path):
     invalid_file.write_text("{invalid json", encoding="utf-8")
 
     with pytest.raises(json.JSONDecodeError):
-        PatternLoader.load_patterns(str(invalid_file))
\ No newline at end of file
+        PatternLoader.load_patterns(str(invalid_file))
+
+def test_pattern_loader_caches_unchanged_file(pattern_json_path):
+    """Test repeated loads of an unchanged file reuse parsed patterns. / 변경되지 않은 파일의 반복 로드가 파싱된 패턴을 재사용하는지 테스트합니다.
+    
+    Args:
+        pattern_json_path: Path to test pattern file / 테스트 패턴 파일 경로
+
+    Verification Items / 검증 항목:
+        1. Verify same pattern objects are returned / 동일한 패턴 객체가 반환되는지 검증
+        2. Verify a new list is returned for each call / 호출마다 새 리스트가 반환되는지 검증
+    """
+    first = PatternLoader.load_patterns(str(pattern_json_path))
+    second = PatternLoader.load_patterns(str(pattern_json_path))
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+def test_pattern_loader_reloads_modified_file(pattern_json_path, tmp_path):
+    """Test a modified pattern file is parsed again. / 수정된 패턴 파일이 다시 파싱되는지 테스트합니다.
+    
+    Args:
+        pattern_json_path: Path to test pattern file / 테스트 패턴 파일 경로
+        tmp_path: Temporary directory path from pytest / pytest의 임시 디렉토리 경로
+
+    Verification Items / 검증 항목:
+        1. Verify patterns reflect the rewritten file / 다시 작성된 파일 내용이 패턴에 반영되는지 검증
+    """
+    pattern_file = tmp_path / "patterns.json"
+    pattern_file.write_text(pattern_json_path.read_text(encoding="utf-8"), encoding="utf-8")
+    PatternLoader.load_patterns(str(pattern_file))
+
+    data = json.loads(pattern_file.read_text(encoding="utf-8"))
+    data["patterns"]["LOW"] = []
+    pattern_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    patterns = PatternLoader.load_patterns(str(pattern_file))
+
+    assert len(patterns) == 3
+
+@pytest.mark.parametrize("pattern, literal", [
+    ("[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}", "@"),
+    ("01[016789]-?\\d{3,4}-?\\d{4}", "01"),
+    ("(?:x-y)+z", "x-y"),
+    ("\\d+", None),
+    ("(?i)abc", None),
+    ("(?i:ab)cd", "cd"),
+])
+def test_required_literal(pattern, literal):
+    """Test extraction of the literal every match must contain. / 모든 일치 항목이 포함해야 하는 리터럴 추출을 테스트합니다.
+    
+    Args:
+        pattern: Regular expression pattern string / 정규표현식 패턴 문자열
+        literal: Expected required literal / 예상 필수 리터럴
+
+    Verification Items / 검증 항목:
+        1. Verify longest required literal is returned / 가장 긴 필수 리터럴이 반환되는지 검증
+        2. Verify None for patterns without a usable literal / 사용 가능한 리터럴이 없는 패턴은 None인지 검증
+    """
+    assert required_literal(pattern) == literal
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("^\\d{6}-\\d{7}$", True),
+    ("(?<!\\d)\\d{6}", True),
+    ("a(?:x|\\Z)", True),
+    ("\\bkim\\b", False),
+    ("01[016789]-?\\d{3,4}-?\\d{4}", False),
+    ("[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}", False),
+    ("(?a)[^\\s\\x1c-\\x1e\\x85\\u2028\\u2029]+", False),
+    ("\\d{6}\\s*-\\s*\\d{7}", True),
+    ("name:[^,]+,", True),
+    ("a\\Wb", True),
+    ("\\D+", True),
+    ("(?s)a.b", True),
+    ("a\\r?\\nb", True),
+    ("a[\\x00-\\x7f]b", True),
+])
+def test_is_line_bound(pattern, expected):
+    """Test detection of patterns that must be searched line by line. / 줄 단위로 검색해야 하는 패턴 감지를 테스트합니다.
+    
+    Args:
+        pattern: Regular expression pattern string / 정규표현식 패턴 문자열
+        expected: Expected line-bound flag / 예상 줄 경계 의존 여부
+
+    Verification Items / 검증 항목:
+        1. Verify anchors and lookarounds are line-bound / 앵커와 전후방 탐색이 줄 경계 의존으로 판단되는지 검증
+        2. Verify word boundaries are not line-bound / 단어 경계는 줄 경계 의존이 아닌지 검증
+        3. Verify tokens that can match a line break are line-bound / 줄바꿈과 일치할 수 있는 토큰이 줄 경계 의존으로 판단되는지 검증
+    """
+    assert is_line_bound(pattern) is expected
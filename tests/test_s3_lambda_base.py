@@ -5,6 +5,14 @@ from src.scan.pattern import DataPattern, RiskLevel
 from src.scan.parsers.s3.lambda_handlers.base import LambdaBaseParser
 
 
+_TEST_PATTERN = DataPattern(
+    name="Test Pattern",
+    pattern=r"\d+",
+    risk_level=RiskLevel.HIGH,
+    description="Test pattern"
+)
+
+
 class MockLambdaParser(LambdaBaseParser):
     """
     Mock parser for testing. / 테스트를 위한 목 파서
@@ -25,14 +33,7 @@ def sample_patterns() -> List[DataPattern]:
     Returns:
         List[DataPattern]: List of test patterns for PII detection / PII 감지를 위한 테스트 패턴 리스트
     """
-    return [
-        DataPattern(
-            name="Test Pattern",
-            pattern=r"\d+",
-            risk_level=RiskLevel.HIGH,
-            description="Test pattern"
-        )
-    ]
+    return [_TEST_PATTERN]
     
 @pytest.fixture
 def sample_s3_event() -> Dict[str, Any]:
@@ -51,24 +52,36 @@ def sample_s3_event() -> Dict[str, Any]:
         }]
     }
     
+@pytest.fixture(scope="module")
+def parser() -> MockLambdaParser:
+    """
+    Create one pattern-less parser shared by the module. / 모듈에서 공유하는 패턴 없는 파서를 생성합니다.
+
+    Returns:
+        MockLambdaParser: Parser instance / 파서 인스턴스
+    """
+    return MockLambdaParser(patterns=[])
+    
     
-def test_get_s3_info(sample_s3_event):
+def test_get_s3_info(parser, sample_s3_event):
     """
     Test S3 info extraction from event. / 이벤트에서 S3 정보 추출을 테스트합니다.
 
     Args:
+        parser (MockLambdaParser): Shared parser fixture / 공유 파서 fixture
         sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
     """
-    parser = MockLambdaParser(patterns=[])
     bucket, key = parser.get_s3_info(sample_s3_event)
     assert bucket == 'test-bucket'
     assert key == 'test/file.txt'
     
-def test_get_s3_info_invalid_event():
+def test_get_s3_info_invalid_event(parser):
     """
     Test error handling for invalid event. / 잘못된 이벤트에 대한 에러 처리를 테스트합니다.
+
+    Args:
+        parser (MockLambdaParser): Shared parser fixture / 공유 파서 fixture
     """
-    parser = MockLambdaParser(patterns=[])
     with pytest.raises(ValueError):
         parser.get_s3_info({})
         
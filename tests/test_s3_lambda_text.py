@@ -0,0 +1,340 @@
+import io
+import time
+import pytest
+from typing import Any, Dict, List
+
+from botocore.response import StreamingBody
+
+from src.scan.pattern import DataPattern, RiskLevel
+from src.scan.parsers.s3.lambda_handlers.text import TextParser
+
+
+class FakeS3Client:
+    """
+    S3 client stub serving one object body from memory. / 메모리의 객체 본문 하나를 제공하는 S3 클라이언트 스텁
+    """
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.requests = 0
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.requests += 1
+        return {'Body': StreamingBody(io.BytesIO(self.body), len(self.body))}
+
+
+@pytest.fixture
+def sample_s3_event() -> Dict[str, Any]:
+    """
+    Create sample S3 event for testing. / 테스트용 S3 이벤트를 생성합니다.
+
+    Returns:
+        Dict[str, Any]: Sample S3 event dictionary / 샘플 S3 이벤트 딕셔너리
+    """
+    return {
+        'Records': [{
+            's3': {
+                'bucket': {'name': 'test-bucket'},
+                'object': {'key': 'test/file.txt'}
+            }
+        }]
+    }
+
+@pytest.fixture(scope="session")
+def sample_patterns() -> List[DataPattern]:
+    """
+    Create sample patterns once per test session. / 테스트 세션당 한 번 샘플 패턴을 생성합니다.
+
+    Returns:
+        List[DataPattern]: Phone number and email patterns / 전화번호와 이메일 패턴 리스트
+    """
+    return [
+        DataPattern(
+            name="Phone Number",
+            pattern=r"01[016789]-?\d{3,4}-?\d{4}",
+            risk_level=RiskLevel.MEDIUM,
+            description="Korea Phone number Pattern"
+        ),
+        DataPattern(
+            name="Email",
+            pattern=r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            risk_level=RiskLevel.LOW,
+            description="Email Pattern"
+        )
+    ]
+
+
+def make_parser(patterns: List[DataPattern], text: str) -> TextParser:
+    """
+    Build a text parser reading fixed text from a stub S3 client. / 스텁 S3 클라이언트에서 고정 텍스트를 읽는 텍스트 파서를 생성합니다.
+
+    Args:
+        patterns (List[DataPattern]): Patterns to detect / 감지할 패턴 리스트
+        text (str): Content of the S3 object / S3 객체 내용
+
+    Returns:
+        TextParser: Parser instance / 파서 인스턴스
+    """
+    parser = TextParser(patterns=patterns, text_extensions={".txt"})
+    parser.s3_client = FakeS3Client(text.encode('utf-8'))
+    return parser
+
+
+def test_scan_reports_line_numbers(sample_patterns, sample_s3_event):
+    """
+    Test matches are reported by line number. / 일치 항목이 줄 번호로 보고되는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "연락처는 010-1234-5678 입니다\n없음\n메일은 user@example.com, 010-9876-5432\n"
+    results = make_parser(sample_patterns, text).scan(sample_s3_event)
+
+    assert results["Type"] == "Text"
+    assert results["Phone Number"] == {"pii-total": 2, "location": [1, 3]}
+    assert results["Email"] == {"pii-total": 1, "location": [3]}
+
+def test_scan_counts_line_once(sample_patterns, sample_s3_event):
+    """
+    Test several matches on one line count as one location. / 한 줄의 여러 일치 항목이 하나의 위치로 계산되는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "010-1234-5678 010-2345-6789\r\n010-3456-7890"
+    results = make_parser(sample_patterns, text).scan(sample_s3_event)
+
+    assert results["Phone Number"] == {"pii-total": 2, "location": [1, 2]}
+    assert results["Email"] is None
+
+def test_scan_keeps_overlapping_patterns(sample_patterns, sample_s3_event):
+    """
+    Test overlapping matches of different patterns are all reported. / 서로 다른 패턴의 겹치는 일치 항목이 모두 보고되는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    results = make_parser(sample_patterns, "01012345678@example.com").scan(sample_s3_event)
+
+    assert results["Phone Number"] == {"pii-total": 1, "location": [1]}
+    assert results["Email"] == {"pii-total": 1, "location": [1]}
+
+def test_scan_with_anchored_pattern(sample_s3_event):
+    """
+    Test line anchors match at every line edge, as with a per-line search. / 줄 단위 검색과 같이 줄 앵커가 모든 줄 경계에서 일치하는지 테스트합니다.
+
+    Args:
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    patterns = [DataPattern(name="RRN", pattern=r"^\d{6}-\d{7}$", risk_level=RiskLevel.HIGH, description="RRN")]
+
+    results = make_parser(patterns, "a\n950101-1234567\n").scan(sample_s3_event)
+    assert results["RRN"] == {"pii-total": 1, "location": [2]}
+
+    results = make_parser(patterns, "a\r\n950101-1234567\r\nb 950101-1234567\r\n").scan(sample_s3_event)
+    assert results["RRN"] == {"pii-total": 1, "location": [2]}
+
+def test_scan_ignores_matches_across_lines(sample_s3_event):
+    """
+    Test matches spanning a line break are not reported. / 줄바꿈에 걸친 일치 항목이 보고되지 않는지 테스트합니다.
+
+    Args:
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    patterns = [
+        DataPattern(name="Spaced RRN", pattern=r"\d{6}\s*-\s*\d{7}", risk_level=RiskLevel.HIGH, description="RRN"),
+        DataPattern(name="Name", pattern=r"name:[^,]+,", risk_level=RiskLevel.LOW, description="Name")
+    ]
+
+    results = make_parser(patterns, "950101\n-1234567\nname: kim\nfoo, bar\n").scan(sample_s3_event)
+    assert results["Spaced RRN"] is None
+    assert results["Name"] is None
+
+    results = make_parser(patterns, "950101\n950101 - 1234567\nname: kim, lee\n").scan(sample_s3_event)
+    assert results["Spaced RRN"] == {"pii-total": 1, "location": [2]}
+    assert results["Name"] == {"pii-total": 1, "location": [3]}
+
+def test_scan_with_pattern_matching_line_breaks(sample_s3_event):
+    """
+    Test patterns whose tokens can match a line break scan a large block in linear time. / 줄바꿈과 일치할 수 있는 토큰을 가진 패턴이 큰 블록을 선형 시간에 검사하는지 테스트합니다.
+
+    Args:
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    patterns = [DataPattern(name="Name", pattern=r"name:[^,]+,", risk_level=RiskLevel.LOW, description="Name")]
+    parser = make_parser(patterns, "name: kim\n" * 50000 + "name: kim, lee\n")
+
+    start = time.perf_counter()
+    results = parser.scan(sample_s3_event)
+
+    assert time.perf_counter() - start < 2
+    assert results["Name"] == {"pii-total": 1, "location": [50001]}
+
+def test_scan_counts_all_line_breaks(sample_patterns, sample_s3_event):
+    """
+    Test lines are numbered on every break str.splitlines() recognises. / str.splitlines()가 인식하는 모든 줄바꿈으로 줄 번호를 매기는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "x\r010-1234-5678\n010-1111-2222\u2028a@example.com\n"
+    results = make_parser(sample_patterns, text).scan(sample_s3_event)
+
+    assert results["Phone Number"] == {"pii-total": 2, "location": [2, 3]}
+    assert results["Email"] == {"pii-total": 1, "location": [4]}
+
+def test_scan_across_chunk_boundaries(sample_patterns, sample_s3_event):
+    """
+    Test line numbers stay correct when the object spans many chunks. / 객체가 여러 청크에 걸칠 때 줄 번호가 올바른지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "가나다라\n" * 5 + "연락처 010-1234-5678\n" + "마바사\n" * 5 + "user@example.com"
+    parser = make_parser(sample_patterns, text)
+    parser.CHUNK_SIZE = 7
+    results = parser.scan(sample_s3_event)
+
+    assert results["Phone Number"] == {"pii-total": 1, "location": [6]}
+    assert results["Email"] == {"pii-total": 1, "location": [12]}
+
+def test_scan_splits_line_breaks_across_chunks(sample_patterns, sample_s3_event):
+    """
+    Test chunk boundaries inside or after a '\\r' break do not change line numbers. / '\\r' 줄바꿈 중간이나 뒤의 청크 경계가 줄 번호를 바꾸지 않는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "abc\r\n010-1234-5678\rx\r\ra@example.com\r\n010-1111-2222\r"
+    for chunk_size in range(1, 8):
+        parser = make_parser(sample_patterns, text)
+        parser.CHUNK_SIZE = chunk_size
+        results = parser.scan(sample_s3_event)
+
+        assert results["Phone Number"] == {"pii-total": 2, "location": [2, 6]}
+        assert results["Email"] == {"pii-total": 1, "location": [5]}
+
+def test_scan_with_long_line(sample_patterns, sample_s3_event):
+    """
+    Test a newline-free body spanning many chunks is scanned in overlapping windows. / 여러 청크에 걸친 줄바꿈 없는 본문이 겹치는 창으로 검사되는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "x" * 95 + "010-1234-5678" + "y" * 200 + "010-2222-3333" + "z" * 100 + "\nuser@example.com"
+    parser = make_parser(sample_patterns, text)
+    parser.CHUNK_SIZE = 8
+    parser.MAX_LINE_LENGTH = 100
+    parser.LINE_OVERLAP = 20
+    results = parser.scan(sample_s3_event)
+
+    assert results["Phone Number"] == {"pii-total": 1, "location": [1]}
+    assert results["Email"] == {"pii-total": 1, "location": [2]}
+
+    parser = make_parser(sample_patterns, "a" * 1000)
+    parser.CHUNK_SIZE = 8
+    parser.MAX_LINE_LENGTH = 100
+    parser.LINE_OVERLAP = 20
+    blocks = list(parser.iter_text_blocks(sample_s3_event))
+
+    assert "".join(block for block, _ in blocks).count("a") < 1000 + 20 * len(blocks)
+    assert max(len(block) for block, _ in blocks) <= 100 + 8
+    assert blocks[-1][1]
+
+def test_extract_text_shares_scan_read_path(sample_patterns, sample_s3_event):
+    """
+    Test extract_text streams through iter_text_blocks like scan. / extract_text가 scan과 같이 iter_text_blocks로 스트리밍하는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    text = "".join(chr(ord("a") + i % 26) for i in range(1000)) + "\r\n010-1234-5678\r"
+    parser = make_parser(sample_patterns, text)
+    parser.CHUNK_SIZE = 8
+    parser.MAX_LINE_LENGTH = 100
+    parser.LINE_OVERLAP = 20
+    assert parser.extract_text(sample_s3_event) == text
+
+    parser.s3_client = FakeS3Client(b"\x89PNG\x00\x00010-1234-5678")
+    assert parser.extract_text(sample_s3_event) is None
+
+    sample_s3_event['Records'][0]['s3']['object']['size'] = 0
+    assert parser.extract_text(sample_s3_event) == ""
+
+def test_scan_with_undecodable_object(sample_patterns, sample_s3_event):
+    """
+    Test scanning returns empty result for undecodable bytes. / 디코딩할 수 없는 바이트에 대해 빈 결과를 반환하는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    parser = make_parser(sample_patterns, "")
+    parser.s3_client = FakeS3Client(b"010-1234-5678\n\xff\xfe")
+
+    assert parser.scan(sample_s3_event) == {}
+
+def test_scan_skips_empty_object(sample_patterns, sample_s3_event):
+    """
+    Test an object reported as empty is not fetched. / 비어 있다고 보고된 객체를 가져오지 않는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    sample_s3_event['Records'][0]['s3']['object']['size'] = 0
+    parser = make_parser(sample_patterns, "")
+    results = parser.scan(sample_s3_event)
+
+    assert parser.s3_client.requests == 0
+    assert results == {"Type": "Text", "Phone Number": None, "Email": None}
+
+def test_scan_skips_binary_object(sample_patterns, sample_s3_event):
+    """
+    Test objects with NUL bytes in the header are skipped with the failure result. / 헤더에 NUL 바이트가 있는 객체를 실패 결과로 건너뛰는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    parser = make_parser(sample_patterns, "")
+    parser.s3_client = FakeS3Client(b"\x89PNG\x00\x00010-1234-5678")
+
+    assert parser.scan(sample_s3_event) == {}
+
+def test_scan_does_not_report_nul_text_as_clean(sample_patterns, sample_s3_event):
+    """
+    Test text with a NUL byte in the header is not reported as free of PII. / 헤더에 NUL 바이트가 있는 텍스트가 개인정보 없음으로 보고되지 않는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    parser = make_parser(sample_patterns, "id\x00name\n010-1234-5678 kim@example.com\n")
+
+    assert parser.scan(sample_s3_event) == {}
+
+def test_can_handle_is_case_insensitive(sample_patterns, sample_s3_event):
+    """
+    Test extension matching ignores case. / 확장자 비교가 대소문자를 구분하지 않는지 테스트합니다.
+
+    Args:
+        sample_patterns (List[DataPattern]): Sample patterns fixture / 샘플 패턴 fixture
+        sample_s3_event (Dict[str, Any]): Sample S3 event fixture / 샘플 S3 이벤트 fixture
+    """
+    parser = TextParser(patterns=sample_patterns, text_extensions={".TXT", ".log"})
+    assert parser.can_handle(sample_s3_event)
+
+    sample_s3_event['Records'][0]['s3']['object']['key'] = 'test/app.LOG'
+    assert parser.can_handle(sample_s3_event)
+
+    sample_s3_event['Records'][0]['s3']['object']['key'] = 'test/image.png'
+    assert not parser.can_handle(sample_s3_event)